@@ -1,3 +1,4 @@
+from async_mojang._http_client import close_default_session
 from async_mojang._types import UserProfile
 from async_mojang.api import API
 from async_mojang.errors import (
@@ -28,4 +29,5 @@ __all__ = [
     "TooManyRequests",
     "Unauthorized",
     "UserProfile",
+    "close_default_session",
 ]
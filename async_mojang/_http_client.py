@@ -1,10 +1,12 @@
 import asyncio
-import json
+import enum
 import logging
-from collections.abc import Awaitable, Callable
-from typing import Any, NoReturn, TypeVar
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from typing import Any, Final, NoReturn, TypeVar, cast, overload
 
 import aiohttp
+import orjson
+from aiohttp.typedefs import StrOrURL
 
 from async_mojang.errors import (
     BadRequest,
@@ -36,13 +38,171 @@ _STATUS_TO_ERROR: dict[int, type[MojangError]] = {
     429: TooManyRequests,
 }
 
+# Dense status -> exception table so dispatch is a single index. 5xx map to
+# ServerError; anything unlisted below 500 falls back to MojangError.
+# Statuses past the table (>= 600) are ServerError, as before.
+_STATUS_TABLE: tuple[type[MojangError], ...] = tuple(
+    ServerError if code >= 500 else _STATUS_TO_ERROR.get(code, MojangError)
+    for code in range(600)
+)
+
 _DEFAULT_MAX_ATTEMPTS = 3
 
+# Built once and shared, rather than constructed per session or per request.
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+class _NotFound(enum.Enum):
+    """Type of the marker _request returns for its not_found_statuses."""
+
+    TOKEN = enum.auto()
+
+
+# Returned by _request, instead of raising, for statuses listed in its
+# not_found_statuses; callers narrow it away with `is`.
+_NOT_FOUND_SENTINEL: Final = _NotFound.TOKEN
+
+# Upper bound on conditional-GET cache entries (oldest evicted first).
+_CACHE_MAX_ENTRIES = 1024
+
+
+class _SharedSession:
+    """Pooled sessions shared by every client that isn't handed one.
+
+    aiohttp sessions are bound to an event loop, so one is kept per loop. It
+    outlives the clients using it, so back-to-back API() instances reuse its
+    keep-alive connections. It is closed by close_default_session(), or
+    automatically when the loop shuts down its async generators (as
+    asyncio.run does on exit).
+    """
+
+    __slots__ = ("_sessions",)
+
+    def __init__(self) -> None:
+        # loop -> (session, shutdown closer, task parking the closer)
+        self._sessions: dict[
+            asyncio.AbstractEventLoop,
+            tuple[
+                aiohttp.ClientSession,
+                AsyncGenerator[None, None],
+                asyncio.Future[None],
+            ],
+        ] = {}
+
+    def acquire(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+        self._forget_closed_loops()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+            ),
+            headers={"User-Agent": _DEFAULT_UA},
+            timeout=_DEFAULT_TIMEOUT,
+        )
+        closer = _close_on_shutdown(session)
+        # Park the generator at its yield so the loop tracks it for shutdown.
+        parking = asyncio.ensure_future(closer.__anext__())
+        self._sessions[loop] = (session, closer, parking)
+        return session
+
+    async def close(self) -> None:
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        self._forget_closed_loops()
+        if entry is not None:
+            session, closer, parking = entry
+            # If the closer hasn't been parked yet, don't let it start after
+            # aclose() below (it would fail with StopAsyncIteration).
+            parking.cancel()
+            await asyncio.wait((parking,))
+            await closer.aclose()
+            await session.close()
+
+    def _forget_closed_loops(self) -> None:
+        """Drop entries for loops that have closed, so neither is kept alive.
+
+        asyncio.run closes their sessions on the way out; a loop closed
+        without shutting down its async generators can't be awaited on any
+        more, so its session is simply released.
+        """
+        for stale in [loop for loop in self._sessions if loop.is_closed()]:
+            del self._sessions[stale]
+
+
+async def _close_on_shutdown(
+    session: aiohttp.ClientSession,
+) -> AsyncGenerator[None, None]:
+    """Close session when the loop finalizes this generator at shutdown."""
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+_default_session = _SharedSession()
+
+
+class _ResponseCache:
+    """Process-wide conditional-GET cache for the shared default session.
+
+    Entries are keyed on (url, deserializer), so a 304 only ever hands back
+    a value of the type the current call asked for. Clients using their own
+    session bypass it: their headers may differ, and the key ignores Vary.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        # (url, deserialize) -> (ETag, Last-Modified, deserialized body)
+        self._entries: dict[
+            tuple[StrOrURL, Callable[[bytes], Any]],
+            tuple[str | None, str | None, Any],
+        ] = {}
+
+    def get(
+        self,
+        url: StrOrURL,
+        deserialize: Callable[[bytes], Any],
+    ) -> tuple[str | None, str | None, Any] | None:
+        return self._entries.get((url, deserialize))
+
+    def remember(
+        self,
+        url: StrOrURL,
+        deserialize: Callable[[bytes], Any],
+        resp: aiohttp.ClientResponse,
+        value: Any,
+    ) -> None:
+        """Cache a GET result if the server gave us a validator to revalidate it."""
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+        key = (url, deserialize)
+        if key not in self._entries and len(self._entries) >= _CACHE_MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (etag, last_modified, value)
+
+
+_response_cache = _ResponseCache()
+
+
+async def close_default_session() -> None:
+    """Close the session shared by API() instances created without one.
+
+    Only needed when the event loop keeps running afterwards; asyncio.run
+    closes it on exit. A later API() opens a fresh shared session.
+    """
+    await _default_session.close()
+
 
 class _HTTPClient:
     __slots__ = (
         "_max_attempts",
-        "_owns_session",
         "_retry",
         "_retry_delay",
         "_session",
@@ -58,68 +218,163 @@ class _HTTPClient:
     ) -> None:
         if max_attempts < 1:
             raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
-        self._owns_session = session is None
-        self._session = session or aiohttp.ClientSession(
-            headers={"User-Agent": _DEFAULT_UA},
-        )
+        # None means "use the shared default session", looked up per request.
+        self._session = session
         self._retry = retry_on_ratelimit
         self._retry_delay = ratelimit_sleep_time
         self._max_attempts = max_attempts
 
-    async def _get_json(self, url: str, **kwargs: Any) -> Any:
-        """GET and return parsed JSON."""
+    def _acquire_session(self) -> aiohttp.ClientSession:
+        """The caller's session, or the shared one for the running loop.
+
+        Fetched on every request so a client keeps working after
+        close_default_session() and across event loops.
+        """
+        if self._session is not None:
+            return self._session
+        return _default_session.acquire()
+
+    async def _get_json(
+        self,
+        url: StrOrURL,
+        *,
+        not_found_statuses: frozenset[int] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """GET and return parsed JSON (or _NOT_FOUND_SENTINEL)."""
         return await self._request(
             "GET",
             url,
-            lambda r: r.json(),
+            orjson.loads,
+            not_found_statuses=not_found_statuses,
             **kwargs,
         )
 
-    async def _post_json(self, url: str, **kwargs: Any) -> Any:
-        """POST and return parsed JSON."""
+    async def _post_json(
+        self,
+        url: StrOrURL,
+        *,
+        not_found_statuses: frozenset[int] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """POST and return parsed JSON (or _NOT_FOUND_SENTINEL)."""
         return await self._request(
             "POST",
             url,
-            lambda r: r.json(),
+            orjson.loads,
+            not_found_statuses=not_found_statuses,
             **kwargs,
         )
 
-    async def _get_text(self, url: str, **kwargs: Any) -> str:
-        """GET and return plain text."""
+    async def _get_bytes(self, url: StrOrURL, **kwargs: Any) -> bytes:
+        """GET and return the raw body."""
         return await self._request(
             "GET",
             url,
-            lambda r: r.text(),
+            bytes,
+            not_found_statuses=None,
             **kwargs,
         )
 
-    async def _request(
-        self,
-        method: str,
-        url: str,
-        deserialize: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
-        **kwargs: Any,
-    ) -> _T:
+    async def _iter_lines(self, url: StrOrURL, **kwargs: Any) -> AsyncIterator[bytes]:
+        """GET and yield body lines as they arrive, never buffering the whole body."""
         for attempt in range(1, self._max_attempts + 1):
-            async with self._session.request(method, url, **kwargs) as resp:
+            async with self._acquire_session().request("GET", url, **kwargs) as resp:
                 _log.debug(
-                    "API %s %s -> %d (attempt %d)",
-                    method,
+                    "API GET %s -> %d (attempt %d, streamed)",
                     url,
                     resp.status,
                     attempt,
                 )
                 if resp.ok:
-                    try:
-                        return await deserialize(resp)
-                    except (json.JSONDecodeError, aiohttp.ContentTypeError) as exc:
-                        raise MalformedResponse(
-                            detail=f"Failed to deserialize {method} {url}: {exc}",
-                        ) from exc
+                    async for line in resp.content:
+                        yield line.rstrip(b"\r\n")
+                    return
                 if await self._maybe_retry(resp, attempt):
                     continue
                 await self._raise_for_status(resp)
 
+    @overload
+    async def _request(
+        self,
+        method: str,
+        url: StrOrURL,
+        deserialize: Callable[[bytes], _T],
+        *,
+        not_found_statuses: None = None,
+        **kwargs: Any,
+    ) -> _T: ...
+
+    @overload
+    async def _request(
+        self,
+        method: str,
+        url: StrOrURL,
+        deserialize: Callable[[bytes], _T],
+        *,
+        not_found_statuses: frozenset[int] | None,
+        **kwargs: Any,
+    ) -> _T | _NotFound: ...
+
+    async def _request(
+        self,
+        method: str,
+        url: StrOrURL,
+        deserialize: Callable[[bytes], _T],
+        *,
+        not_found_statuses: frozenset[int] | None = None,
+        **kwargs: Any,
+    ) -> _T | _NotFound:
+        # Only requests on the shared default session, whose headers we
+        # control, may reuse cached bodies.
+        use_cache = method == "GET" and self._session is None
+        cached = _response_cache.get(url, deserialize) if use_cache else None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = dict(kwargs.get("headers") or {})
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+            kwargs["headers"] = headers
+
+        for attempt in range(1, self._max_attempts + 1):
+            # Mojang bodies are small: read once and hand the connection back
+            # to the pool before deserializing, instead of holding it throughout.
+            resp = await self._acquire_session().request(method, url, **kwargs)
+            try:
+                body = await resp.read()
+            finally:
+                resp.release()
+            _log.debug(
+                "API %s %s -> %d (attempt %d)",
+                method,
+                url,
+                resp.status,
+                attempt,
+            )
+            if resp.status == 304 and cached is not None:
+                return cast(_T, cached[2])
+            if resp.ok:
+                try:
+                    value = deserialize(body)
+                except ValueError as exc:  # JSONDecodeError, UnicodeDecodeError
+                    raise MalformedResponse(
+                        detail=f"Failed to deserialize {method} {url}: {exc}",
+                    ) from exc
+                if use_cache:
+                    _response_cache.remember(url, deserialize, resp, value)
+                return value
+            if not_found_statuses is not None and resp.status in not_found_statuses:
+                # Expected misses: skip building and unwinding an exception.
+                return _NOT_FOUND_SENTINEL
+            if await self._maybe_retry(resp, attempt):
+                continue
+            await self._raise_for_status(resp)
+
+        # The final attempt never retries, so the loop always returns or raises.
+        raise AssertionError("unreachable")
+
     async def _maybe_retry(
         self,
         resp: aiohttp.ClientResponse,
@@ -133,8 +388,6 @@ class _HTTPClient:
         if attempt >= self._max_attempts:
             return False
 
-        await resp.read()  # drain body before retry
-
         if resp.status == 429 and self._retry:
             _log.warning(
                 "Rate-limited (attempt %d/%d). Sleeping %ss.",
@@ -146,7 +399,7 @@ class _HTTPClient:
             return True
 
         if resp.status in (502, 503, 504):
-            delay = 2 ** (attempt - 1)
+            delay = 1 << (attempt - 1)
             _log.warning(
                 "Transient server error %d (attempt %d/%d). Retrying in %ds.",
                 resp.status,
@@ -169,18 +422,12 @@ class _HTTPClient:
                 or error_data.get("error")
                 or f"HTTP {resp.status}"
             )
-        except (json.JSONDecodeError, aiohttp.ContentTypeError):
+        except (ValueError, aiohttp.ContentTypeError):
             detail = f"HTTP {resp.status} {resp.reason or 'error'} for {resp.url.path}"
 
-        if exc_cls := _STATUS_TO_ERROR.get(resp.status):
-            raise exc_cls(status=resp.status, detail=detail)
-
-        if resp.status >= 500:
-            raise ServerError(status=resp.status, detail=detail)
-
-        raise MojangError(status=resp.status, detail=detail)
+        status = resp.status
+        exc_cls = _STATUS_TABLE[status] if status < 600 else ServerError
+        raise exc_cls(status=status, detail=detail)
 
     async def close(self) -> None:
-        """Close the session if we created it."""
-        if self._owns_session and not self._session.closed:
-            await self._session.close()
+        """No-op: the shared session outlives clients; a caller's session is theirs."""
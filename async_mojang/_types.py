@@ -1,9 +1,8 @@
 import uuid
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True, slots=True, kw_only=True)
-class UserProfile:
+class UserProfile(NamedTuple):
     id: uuid.UUID
     timestamp: int
     name: str
@@ -1,16 +1,38 @@
+import binascii
+import re
 import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+
+from async_mojang._types import UserProfile
+from async_mojang.errors import MalformedResponse
+
+_USERNAME_RE = re.compile(r"[\x00-\x7f]{3,16}").fullmatch
+
+# Shared read-only default for absent texture sections, so missing keys
+# don't allocate a throwaway dict on every profile.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 def _assert_valid_username(username: str) -> None:
     """Raise ValueError for usernames outside 3–16 ASCII characters."""
+    if _USERNAME_RE(username):
+        return
     if len(username) < 3 or len(username) > 16:
         raise ValueError(
             f"Invalid username {username!r}: must be between 3 and 16 characters",
         )
-    if not username.isascii():
-        raise ValueError(
-            f"Invalid username {username!r}: contains non-ASCII characters",
-        )
+    raise ValueError(
+        f"Invalid username {username!r}: contains non-ASCII characters",
+    )
+
+
+def _fast_uuid(hex32: str) -> uuid.UUID:
+    """Build a UUID from Mojang's undashed 32-char hex, skipping format detection."""
+    return uuid.UUID(bytes=bytes.fromhex(hex32))
 
 
 def _parse_uuid(value: uuid.UUID | str) -> uuid.UUID:
@@ -21,3 +43,34 @@ def _parse_uuid(value: uuid.UUID | str) -> uuid.UUID:
         return uuid.UUID(value)
     except ValueError as exc:
         raise ValueError(f"Invalid UUID: {value!r}") from exc
+
+
+def _parse_profile(data: dict[str, Any]) -> UserProfile:
+    """Decode the base64 textures blob into a UserProfile."""
+    try:
+        value = data["properties"][0]["value"]
+        decoded: dict[str, Any] = orjson.loads(binascii.a2b_base64(value))
+    except (KeyError, IndexError, orjson.JSONDecodeError, binascii.Error) as exc:
+        raise MalformedResponse(
+            detail=f"Cannot decode profile textures: {exc}",
+        ) from exc
+
+    textures: Mapping[str, Any] = decoded.get("textures") or _EMPTY
+    skin: Mapping[str, Any] = textures.get("SKIN") or _EMPTY
+    cape: Mapping[str, Any] = textures.get("CAPE") or _EMPTY
+    metadata: Mapping[str, Any] = skin.get("metadata") or _EMPTY
+
+    try:
+        return UserProfile(
+            _fast_uuid(decoded["profileId"]),
+            decoded["timestamp"],
+            decoded["profileName"],
+            bool(decoded.get("legacy")),
+            metadata.get("model", "classic"),
+            skin.get("url"),
+            cape.get("url"),
+        )
+    except (KeyError, ValueError) as exc:
+        raise MalformedResponse(
+            detail=f"Profile payload missing or invalid field: {exc}",
+        ) from exc
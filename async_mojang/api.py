@@ -1,27 +1,158 @@
 """Public async API for Mojang services."""
 
-import base64
-import binascii
-import json
+import asyncio
+import functools
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
+import yarl
 
-from async_mojang._http_client import _DEFAULT_MAX_ATTEMPTS, _HTTPClient
+from async_mojang._http_client import (
+    _DEFAULT_MAX_ATTEMPTS,
+    _NOT_FOUND_SENTINEL,
+    _HTTPClient,
+    _NotFound,
+)
 from async_mojang._types import UserProfile
-from async_mojang._utils import _assert_valid_username, _parse_uuid
-from async_mojang.errors import BadRequest, MalformedResponse, NotFound
+from async_mojang._utils import (
+    _assert_valid_username,
+    _fast_uuid,
+    _parse_profile,
+    _parse_uuid,
+)
+from async_mojang.errors import MalformedResponse
 
 _API_BASE_URL = "https://api.mojang.com"
 _SESSIONSERVER_BASE_URL = "https://sessionserver.mojang.com"
 _UUID_API_URL = "https://api.minecraftservices.com/minecraft/profile/lookup/name"
 
+# Parsed once; aiohttp uses yarl.URL objects as-is instead of re-parsing strings.
+_API_BASE = yarl.URL(_API_BASE_URL)
+_SESSIONSERVER_BASE = yarl.URL(_SESSIONSERVER_BASE_URL)
+_UUID_BASE = yarl.URL(_UUID_API_URL)
+
+_PROFILE_BASE = _SESSIONSERVER_BASE / "session/minecraft/profile"
+_BULK_UUID_URL = _API_BASE / "profiles/minecraft"
+_BLOCKED_SERVERS_URL = _SESSIONSERVER_BASE / "blockedservers"
+
+_URL_CACHE_SIZE = 1024
+
 _MAX_BATCH = 10  # API limitation
+_BATCH_WINDOW = 0.005  # seconds to collect get_uuid(batch=True) calls
 
 # Mojang endpoints may return 400 or 404 for "player not found".
-# We map both to None in lookup methods.
-_NOT_FOUND_ERRORS = (NotFound, BadRequest)
+# _request hands these back as _NOT_FOUND_SENTINEL instead of raising,
+# and lookup methods map that to None.
+_NOT_FOUND_STATUSES = frozenset({400, 404})
+
+
+# Hot lookup loops hit the same few names/UUIDs; reuse their parsed URLs.
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _uuid_url(username: str) -> yarl.URL:
+    return _UUID_BASE / username
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _profile_url(uid_hex: str) -> yarl.URL:
+    return _PROFILE_BASE / uid_hex
+
+
+class _PendingBatch:
+    """Coalesce concurrent single-name UUID lookups into bulk requests.
+
+    Names queued within _BATCH_WINDOW of each other (or until _MAX_BATCH
+    accumulate) are resolved with one bulk request. If Mojang rejects that
+    request outright, each name falls back to its own lookup.
+    """
+
+    __slots__ = ("_api", "_futures", "_handle", "_tasks")
+
+    def __init__(self, api: "API") -> None:
+        self._api = api
+        # Keyed by lowercased name: Mojang matches names case-insensitively.
+        self._futures: dict[str, asyncio.Future[uuid.UUID | None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def lookup(self, username: str) -> asyncio.Future[uuid.UUID | None]:
+        key = username.lower()
+        if (fut := self._futures.get(key)) is not None:
+            return fut
+        loop = asyncio.get_running_loop()
+        fut = self._futures[key] = loop.create_future()
+        if len(self._futures) >= _MAX_BATCH:
+            self._flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(_BATCH_WINDOW, self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._futures = self._futures, {}
+        if batch:
+            task = asyncio.create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self,
+        batch: dict[str, asyncio.Future[uuid.UUID | None]],
+    ) -> None:
+        try:
+            found = await self._api._lookup_uuids(list(batch))
+        except asyncio.CancelledError:
+            for fut in batch.values():
+                fut.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 - every failure must reach the waiters
+            # The same instance goes to each of the (at most _MAX_BATCH) futures,
+            # so every re-raising caller appends its frames to one shared
+            # __traceback__. Library errors have keyword-only constructors and
+            # can't be cloned generically, so the sharing is accepted.
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        if found is _NOT_FOUND_SENTINEL:
+            if len(batch) > 1:
+                # Mojang rejects the whole request over one bad name, and the
+                # batch mixes unrelated callers: look each name up on its own.
+                await asyncio.gather(
+                    *(self._resolve_one(key, fut) for key, fut in batch.items()),
+                )
+                return
+            found = {}
+        by_key = {name.lower(): uid for name, uid in found.items()}
+        for key, fut in batch.items():
+            if not fut.done():
+                fut.set_result(by_key.get(key))
+
+    async def _resolve_one(
+        self,
+        key: str,
+        fut: asyncio.Future[uuid.UUID | None],
+    ) -> None:
+        try:
+            uid = await self._api.get_uuid(key)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as exc:  # noqa: BLE001 - the failure belongs to this waiter
+            if not fut.done():
+                fut.set_exception(exc)
+        else:
+            if not fut.done():
+                fut.set_result(uid)
+
+    async def drain(self) -> None:
+        """Send anything still queued and wait for in-flight batches."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 class API:
@@ -47,15 +178,29 @@ class API:
             ratelimit_sleep_time=ratelimit_sleep_time,
             max_attempts=max_attempts,
         )
+        self._batch = _PendingBatch(self)
 
-    async def get_uuid(self, username: str) -> uuid.UUID | None:
-        """Look up a player's UUID by username, or None if not found."""
+    async def get_uuid(
+        self,
+        username: str,
+        *,
+        batch: bool = False,
+    ) -> uuid.UUID | None:
+        """Look up a player's UUID by username, or None if not found.
+
+        With batch=True, concurrent lookups are coalesced into bulk requests
+        of up to 10 names, trading a few milliseconds of latency for far
+        fewer round-trips.
+        """
         _assert_valid_username(username)
-        try:
-            data: dict[str, Any] = await self._http._get_json(
-                f"{_UUID_API_URL}/{username}",
-            )
-        except _NOT_FOUND_ERRORS:
+        if batch:
+            # Shielded so one cancelled caller doesn't cancel a shared lookup.
+            return await asyncio.shield(self._batch.lookup(username))
+        data: dict[str, Any] | _NotFound = await self._http._get_json(
+            _uuid_url(username),
+            not_found_statuses=_NOT_FOUND_STATUSES,
+        )
+        if data is _NOT_FOUND_SENTINEL:
             return None
 
         try:
@@ -65,7 +210,7 @@ class API:
                 detail=f"UUID lookup response missing 'id': {exc}",
             ) from exc
 
-        return uuid.UUID(raw) if raw else None
+        return _fast_uuid(raw) if raw else None
 
     async def get_uuids(self, names: list[str]) -> dict[str, uuid.UUID]:
         """Batch-convert up to 10 usernames to UUIDs.
@@ -79,15 +224,26 @@ class API:
             )
         for name in names:
             _assert_valid_username(name)
+        found = await self._lookup_uuids(names)
+        return {} if found is _NOT_FOUND_SENTINEL else found
+
+    async def _lookup_uuids(
+        self,
+        names: list[str],
+    ) -> dict[str, uuid.UUID] | _NotFound:
+        """POST already-validated names to the bulk endpoint.
+
+        Returns _NOT_FOUND_SENTINEL when Mojang rejects the request as a whole.
+        """
+        data: list[dict[str, Any]] | _NotFound = await self._http._post_json(
+            _BULK_UUID_URL,
+            json=names,
+            not_found_statuses=_NOT_FOUND_STATUSES,
+        )
+        if data is _NOT_FOUND_SENTINEL:
+            return _NOT_FOUND_SENTINEL
         try:
-            data: list[dict[str, Any]] = await self._http._post_json(
-                f"{_API_BASE_URL}/profiles/minecraft",
-                json=names,
-            )
-        except _NOT_FOUND_ERRORS:
-            return {}
-        try:
-            return {entry["name"]: uuid.UUID(entry["id"]) for entry in data}
+            return {entry["name"]: _fast_uuid(entry["id"]) for entry in data}
         except (TypeError, KeyError, ValueError) as exc:
             raise MalformedResponse(
                 detail=f"Unexpected batch-lookup response shape: {exc}",
@@ -96,11 +252,11 @@ class API:
     async def get_username(self, player: uuid.UUID | str) -> str | None:
         """Convert a UUID to its current username, or None if not found."""
         uid = _parse_uuid(player)
-        try:
-            data: dict[str, Any] = await self._http._get_json(
-                f"{_SESSIONSERVER_BASE_URL}/session/minecraft/profile/{uid.hex}",
-            )
-        except _NOT_FOUND_ERRORS:
+        data: dict[str, Any] | _NotFound = await self._http._get_json(
+            _profile_url(uid.hex),
+            not_found_statuses=_NOT_FOUND_STATUSES,
+        )
+        if data is _NOT_FOUND_SENTINEL:
             return None
         try:
             return data["name"]
@@ -112,23 +268,48 @@ class API:
     async def get_profile(self, player: uuid.UUID | str) -> UserProfile | None:
         """Full profile with decoded texture data, or None if not found."""
         uid = _parse_uuid(player)
-        try:
-            data: dict[str, Any] = await self._http._get_json(
-                f"{_SESSIONSERVER_BASE_URL}/session/minecraft/profile/{uid.hex}",
-            )
-        except _NOT_FOUND_ERRORS:
+        data: dict[str, Any] | _NotFound = await self._http._get_json(
+            _profile_url(uid.hex),
+            not_found_statuses=_NOT_FOUND_STATUSES,
+        )
+        if data is _NOT_FOUND_SENTINEL:
             return None
         return _parse_profile(data)
 
     async def get_blocked_servers(self) -> list[str]:
         """SHA-1 hashes of blocked Minecraft servers."""
-        text: str = await self._http._get_text(
-            f"{_SESSIONSERVER_BASE_URL}/blockedservers"
-        )
-        return text.splitlines()
+        body = await self._http._get_bytes(_BLOCKED_SERVERS_URL)
+        try:
+            # Hex digests are pure ASCII, which decodes faster than UTF-8.
+            return body.decode("ascii").splitlines()
+        except UnicodeDecodeError as exc:
+            raise MalformedResponse(
+                detail=f"Blocked-servers list is not ASCII: {exc}",
+            ) from exc
+
+    async def get_blocked_servers_bytes(self) -> list[bytes]:
+        """SHA-1 hashes of blocked Minecraft servers as undecoded ASCII bytes."""
+        body = await self._http._get_bytes(_BLOCKED_SERVERS_URL)
+        return body.splitlines()
+
+    async def iter_blocked_servers(self) -> AsyncIterator[str]:
+        """Yield blocked-server SHA-1 hashes as they are received.
+
+        Unlike get_blocked_servers, the full list is never held in memory.
+        The connection stays checked out until iteration finishes.
+        """
+        async for line in self._http._iter_lines(_BLOCKED_SERVERS_URL):
+            try:
+                server_hash = line.decode("ascii")
+            except UnicodeDecodeError as exc:
+                raise MalformedResponse(
+                    detail=f"Blocked-servers list is not ASCII: {exc}",
+                ) from exc
+            yield server_hash
 
     async def close(self) -> None:
         """Close the underlying HTTP session."""
+        await self._batch.drain()
         await self._http.close()
 
     async def __aenter__(self) -> "API":
@@ -136,32 +317,3 @@ class API:
 
     async def __aexit__(self, *exc: object) -> None:
         await self.close()
-
-
-def _parse_profile(data: dict[str, Any]) -> UserProfile:
-    """Decode the base64 textures blob into a UserProfile."""
-    try:
-        value = data["properties"][0]["value"]
-        decoded: dict[str, Any] = json.loads(base64.b64decode(value))
-    except (KeyError, IndexError, json.JSONDecodeError, binascii.Error) as exc:
-        raise MalformedResponse(
-            detail=f"Cannot decode profile textures: {exc}",
-        ) from exc
-
-    textures: dict[str, Any] = decoded.get("textures", {})
-    skin: dict[str, Any] = textures.get("SKIN", {})
-
-    try:
-        return UserProfile(
-            id=uuid.UUID(decoded["profileId"]),
-            timestamp=decoded["timestamp"],
-            name=decoded["profileName"],
-            is_legacy_profile=bool(decoded.get("legacy")),
-            skin_url=skin.get("url"),
-            skin_variant=skin.get("metadata", {}).get("model", "classic"),
-            cape_url=textures.get("CAPE", {}).get("url"),
-        )
-    except (KeyError, ValueError) as exc:
-        raise MalformedResponse(
-            detail=f"Profile payload missing or invalid field: {exc}",
-        ) from exc
@@ -1,5 +1,15 @@
+import os
+
 from setuptools import find_packages, setup
 
+# Opt-in: compile the pure-Python parsing helpers to a C extension with mypyc.
+# Requires mypy at build time; the package works identically without it.
+ext_modules = []
+if os.environ.get("ASYNC_MOJANG_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["async_mojang/_utils.py"])
+
 setup(
     name="async-mojang",
     version="2.0.0",
@@ -9,6 +19,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/FroostySnoowman/Async-Mojang",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Intended Audience :: Developers",
@@ -30,6 +41,8 @@ setup(
     python_requires=">=3.10",
     install_requires=[
         "aiohttp>=3.8,<4",
+        "orjson>=3.9",
+        "yarl>=1.9,<2",
     ],
     keywords=[
         "mojang",
@@ -1,14 +1,49 @@
 """Smoke tests against the live Mojang API."""
 
 import asyncio
+import uuid
+from typing import Any
 
 from async_mojang import API
+from async_mojang._http_client import _NOT_FOUND_SENTINEL
+
+_NOTCH = uuid.UUID("069a79f444e94726a5befca90e38aaf5")
+
+
+class _FakeHTTP:
+    """Offline stand-in for _HTTPClient: the bulk endpoint 400s on any bad name."""
+
+    async def _post_json(self, url: Any, *, json: list[str], **kwargs: Any) -> Any:
+        if any(" " in name for name in json):
+            return _NOT_FOUND_SENTINEL
+        return [{"name": "Notch", "id": _NOTCH.hex} for n in json if n == "notch"]
+
+    async def _get_json(self, url: Any, **kwargs: Any) -> Any:
+        if str(url).endswith("/notch"):
+            return {"id": _NOTCH.hex, "name": "Notch"}
+        return _NOT_FOUND_SENTINEL
+
+    async def close(self) -> None:
+        pass
+
+
+async def check_batch_fallback() -> None:
+    """Offline: one name rejected by the bulk endpoint must not blank the batch."""
+    async with API() as api:
+        api._http = _FakeHTTP()  # type: ignore[assignment]
+        found = await asyncio.gather(
+            api.get_uuid("Notch", batch=True),
+            api.get_uuid("ab cd", batch=True),
+        )
+        assert found == [_NOTCH, None], found
+        print("Batch 400  : fell back to single lookups")
 
 
 async def main() -> None:
     async with API() as api:
         uid = await api.get_uuid("FroostySnoowman")
         print(f"UUID       : {uid}")
+        print(f"Batch UUID : {await api.get_uuid('FroostySnoowman', batch=True)}")
 
         if uid is not None:
             username = await api.get_username(uid)
@@ -19,7 +54,11 @@ async def main() -> None:
 
         servers = await api.get_blocked_servers()
         print(f"Blocked    : {len(servers)} servers")
+        print(f"Blocked raw: {len(await api.get_blocked_servers_bytes())} servers")
+        streamed = [h async for h in api.iter_blocked_servers()]
+        print(f"Streamed   : {len(streamed)} servers")
 
 
 if __name__ == "__main__":
+    asyncio.run(check_batch_fallback())
     asyncio.run(main())